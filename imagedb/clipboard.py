@@ -3,45 +3,73 @@ from __future__ import annotations
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Callable
+
+
+# Read clipboard tool output in fixed-size chunks straight from the pipe.
+READ_CHUNK_SIZE = 65536
+
+# Resolve clipboard tools once; PATH does not change during a CLI run.
+_WL_PASTE = shutil.which("wl-paste")
+_WL_COPY = shutil.which("wl-copy")
+_XCLIP = shutil.which("xclip")
 
 
 class ClipboardError(RuntimeError):
     pass
 
 
-def _require_tool(tool_name: str) -> None:
-    if not shutil.which(tool_name):
+def _require_tool(tool_path: str | None) -> None:
+    if not tool_path:
         raise ClipboardError(
             "No suitable clipboard utility found (install wl-clipboard or xclip)."
         )
 
 
-def read_image_from_clipboard() -> bytes:
+def _read_command_output(
+    args: list[str], on_chunk: Callable[[bytes], None] | None = None
+) -> bytes | None:
+    """
+    Run a command and read its stdout in chunks, passing each to on_chunk.
+    Returns None if the command fails or produces no output.
+    """
+    chunks = []
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    ) as proc:
+        while chunk := proc.stdout.read(READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+
+    if proc.returncode != 0 or not chunks:
+        return None
+    return b"".join(chunks)
+
+
+def read_image_from_clipboard(
+    on_chunk: Callable[[bytes], None] | None = None,
+) -> bytes:
     """
     Read PNG bytes from the clipboard using wl-paste or xclip.
+    If given, on_chunk is called with each chunk as it is read.
     Raises ClipboardError if no image data is available.
     """
-    if shutil.which("wl-paste"):
-        result = subprocess.run(
-            ["wl-paste", "--type", "image/png"],
-            capture_output=True,
-            check=False,
-        )
-        if result.returncode == 0 and result.stdout:
-            return result.stdout
+    if _WL_PASTE:
+        data = _read_command_output(["wl-paste", "--type", "image/png"], on_chunk)
+        if data:
+            return data
         raise ClipboardError("No image data found in clipboard (Wayland).")
 
-    if shutil.which("xclip"):
-        result = subprocess.run(
-            ["xclip", "-selection", "clipboard", "-t", "image/png", "-o"],
-            capture_output=True,
-            check=False,
+    if _XCLIP:
+        data = _read_command_output(
+            ["xclip", "-selection", "clipboard", "-t", "image/png", "-o"], on_chunk
         )
-        if result.returncode == 0 and result.stdout:
-            return result.stdout
+        if data:
+            return data
         raise ClipboardError("No image data found in clipboard (X11).")
 
-    _require_tool("wl-paste")  # will raise
+    _require_tool(_WL_PASTE)  # will raise
     return b""
 
 
@@ -53,12 +81,12 @@ def copy_image_to_clipboard(image_path: str | Path) -> None:
     if not image_path.exists():
         raise FileNotFoundError(f"Image not found at {image_path}")
 
-    if shutil.which("wl-copy"):
+    if _WL_COPY:
         with image_path.open("rb") as f:
             subprocess.run(["wl-copy", "--type", "image/png"], stdin=f, check=True)
         return
 
-    if shutil.which("xclip"):
+    if _XCLIP:
         with image_path.open("rb") as f:
             subprocess.run(
                 ["xclip", "-selection", "clipboard", "-t", "image/png"],
@@ -67,5 +95,5 @@ def copy_image_to_clipboard(image_path: str | Path) -> None:
             )
         return
 
-    _require_tool("wl-copy")  # will raise
+    _require_tool(_WL_COPY)  # will raise
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 from typing import Any, Dict
@@ -20,6 +21,67 @@ def get_config_path() -> Path:
     return config_dir / "config.yaml"
 
 
+def _get_cache_path(config_path: Path) -> Path:
+    """
+    Return the path to the parsed JSON copy of the YAML config.
+    """
+    return config_path.with_suffix(".json")
+
+
+def _file_mode(path: Path, default: int = 0o600) -> int:
+    """
+    Return the permission bits of path, or default if it does not exist.
+    """
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        return default
+
+
+def _write_atomic(path: Path, content: str, mode: int) -> None:
+    """
+    Write content to a temp file with the given mode and swap it into place,
+    so readers never see a half-written file and the mode is never widened.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    os.fchmod(fd, mode)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _write_cache(config_path: Path, data: Dict[str, Any]) -> None:
+    """
+    Write the JSON copy of the config with the same mode as config.yaml.
+    Raises TypeError or ValueError if the data is not JSON-serializable.
+    """
+    content = json.dumps(data)
+    _write_atomic(_get_cache_path(config_path), content, _file_mode(config_path))
+
+
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Read the YAML config, preferring the JSON cache when it is newer.
+    """
+    cache_path = _get_cache_path(config_path)
+    try:
+        if cache_path.stat().st_mtime_ns > config_path.stat().st_mtime_ns:
+            with cache_path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with config_path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    try:
+        _write_cache(config_path, data)
+    except (OSError, TypeError, ValueError):
+        # Values JSON cannot represent (e.g. YAML dates) just skip the cache
+        pass
+    return data
+
+
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from disk.
@@ -29,8 +91,7 @@ def load_config() -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config not found at {config_path}. Run `imagedb init`.")
 
-    with config_path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data = _read_config_file(config_path)
 
     if "api_key" not in data or not data["api_key"]:
         raise ValueError("Config missing 'api_key'. Run `imagedb init`.")
@@ -44,6 +105,7 @@ def load_config() -> Dict[str, Any]:
 def save_config(api_key: str, vision_model: str | None = None) -> Path:
     """
     Persist configuration to disk. Returns the path written.
+    Leaves the file untouched if its contents would not change.
     """
     config_path = get_config_path()
     vision = vision_model or DEFAULT_VISION_MODEL
@@ -51,7 +113,15 @@ def save_config(api_key: str, vision_model: str | None = None) -> Path:
         "api_key": api_key,
         "vision_model": vision,
     }
-    with config_path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(payload, f)
+    content = yaml.safe_dump(payload)
+    try:
+        if config_path.read_text(encoding="utf-8") == content:
+            return config_path
+    except FileNotFoundError:
+        pass
+
+    # Swap in a complete file, keeping the existing mode since it holds the API key
+    _write_atomic(config_path, content, _file_mode(config_path))
+    _write_cache(config_path, payload)
     return config_path
 
@@ -1,9 +1,45 @@
 import lancedb
+import math
+import numpy as np
 import os
+import pyarrow as pa
 from pathlib import Path
 from datetime import datetime
+from typing import Iterable
 from .image_record import ImageRecord
 
+# Build an ANN index once brute-force scans start to cost more than training it.
+INDEX_MIN_ROWS = 256
+OPTIMIZE_EVERY = 100
+DISTANCE_METRIC = "cosine"
+# Re-rank this many times the requested results on full vectors, so returned
+# distances are exact rather than PQ approximations.
+REFINE_FACTOR = 10
+
+
+def _num_sub_vectors(dim: int, max_sub_vectors: int = 96) -> int:
+    """
+    Largest PQ sub-vector count up to max_sub_vectors that evenly divides dim.
+    """
+    for count in range(min(max_sub_vectors, dim // 16), 0, -1):
+        if dim % count == 0:
+            return count
+    return 1
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _hash_predicate(file_hashes: Iterable[str]) -> str:
+    """
+    Builds a single LanceDB filter matching any of the given file hashes.
+    """
+    quoted = [_quote(file_hash) for file_hash in file_hashes]
+    if len(quoted) == 1:
+        return "file_hash = " + quoted[0]
+    return "file_hash IN (" + ", ".join(quoted) + ")"
+
 
 class ImageDB:
     def __init__(self, db_path: str = None):
@@ -21,71 +57,180 @@ class ImageDB:
         self.db_dir.parent.mkdir(parents=True, exist_ok=True)
         self.image_dir.mkdir(parents=True, exist_ok=True)
 
-        # Connect to embedded DB
-        self.db = lancedb.connect(self.db_dir)
-        
-        # Create or open the table
-        # We pass the Schema class so it knows how to format the data
+        # Connection and table are opened on first use, so callers that only
+        # need image_dir never touch LanceDB
         self.table_name = "images"
-        if self.table_name not in self.db.table_names():
-            self.table = self.db.create_table(self.table_name, schema=ImageRecord)
-        else:
-            self.table = self.db.open_table(self.table_name)
+        self._db = None
+        self._table = None
+
+    @property
+    def db(self):
+        # Connect to embedded DB
+        if self._db is None:
+            self._db = lancedb.connect(self.db_dir)
+        return self._db
 
-    def add_image(self, embedding: list[float], description: str, file_hash: str, original_filename: str):
+    @property
+    def table(self):
+        if self._table is None:
+            # Create or open the table
+            # We pass the Schema class so it knows how to format the data
+            if self.table_name not in self.db.table_names():
+                self._table = self.db.create_table(self.table_name, schema=ImageRecord)
+            else:
+                self._table = self.db.open_table(self.table_name)
+        return self._table
+
+    def _ensure_index(self, row_count: int) -> bool:
+        """
+        Creates an IVF_PQ index on the vector column once the table is large enough.
+        Returns True if an index was created.
+        """
+        if row_count < INDEX_MIN_ROWS or self.table.list_indices():
+            return False
+
+        dim = self.table.schema.field("vector").type.list_size
+        self.table.create_index(
+            vector_column_name="vector",
+            index_type="IVF_PQ",
+            metric=DISTANCE_METRIC,
+            num_partitions=max(1, int(math.sqrt(row_count))),
+            num_sub_vectors=_num_sub_vectors(dim),
+        )
+        return True
+
+    def add_image(self, embedding: np.ndarray, description: str, file_hash: str, original_filename: str):
         """
         Saves the metadata to LanceDB.
         """
         # Construct the local path where you saved the image
         image_path = str(self.image_dir / f"{file_hash}.png")
-        
-        data = ImageRecord(
-            vector=embedding,
-            filename=original_filename or "clipboard.png",
-            file_hash=file_hash,
-            description=description,
-            created_at=datetime.now(),
-            path=image_path
+
+        # Build the row as Arrow data so the vector is handed over as one
+        # contiguous buffer instead of 4096 Python floats
+        vector_type = self.table.schema.field("vector").type
+        values = pa.array(np.asarray(embedding, dtype=np.float32)).cast(vector_type.value_type)
+        data = pa.Table.from_pydict(
+            {
+                "vector": pa.FixedSizeListArray.from_arrays(values, vector_type.list_size),
+                "filename": [original_filename or "clipboard.png"],
+                "file_hash": [file_hash],
+                "description": [description],
+                "created_at": [datetime.now()],
+                "path": [image_path],
+            },
+            schema=self.table.schema,
         )
         
         # Add to table
-        self.table.add([data])
+        self.table.add(data)
+
+        # Build the index once the table crosses the threshold; afterwards fold
+        # new rows into it and compact fragments periodically
+        row_count = self.table.count_rows()
+        if not self._ensure_index(row_count) and row_count % OPTIMIZE_EVERY == 0:
+            self.table.optimize()
 
-    def search(self, query_vector: list[float], limit: int = 1):
+    def search(self, query_vector: np.ndarray, limit: int = 1):
         """
         Performs the vector search.
         """
         # This is the "magic" line for vector search
-        results = self.table.search(query_vector).limit(limit).to_list()
+        results = (
+            self.table.search(query_vector)
+            .distance_type(DISTANCE_METRIC)
+            .refine_factor(REFINE_FACTOR)
+            .limit(limit)
+            .to_list()
+        )
         
         return results
 
+    def search_batch(self, query_vectors: list[np.ndarray], limit: int = 1) -> list[list[dict]]:
+        """
+        Performs one vector search for several query vectors at once.
+        Returns a list of results per query vector, in input order.
+        """
+        if not query_vectors:
+            return []
+        if len(query_vectors) == 1:
+            return [self.search(query_vectors[0], limit=limit)]
+
+        rows = (
+            self.table.search(query_vectors)
+            .distance_type(DISTANCE_METRIC)
+            .refine_factor(REFINE_FACTOR)
+            .limit(limit)
+            .to_list()
+        )
+
+        # LanceDB tags each row with the position of the query it matched
+        grouped = [[] for _ in query_vectors]
+        for row in rows:
+            grouped[row.pop("query_index")].append(row)
+        return grouped
+
+    def has_image(self, file_hash: str) -> bool:
+        """
+        Returns True if a record with the given file hash is already stored.
+        """
+        results = (
+            self.table.search(None)
+            .where(_hash_predicate([file_hash]))
+            .limit(1)
+            .to_list()
+        )
+        return bool(results)
+
     def delete_image(self, file_hash: str) -> bool:
         """
         Deletes an image from the database by file hash.
         Returns True if the image was found and deleted, False otherwise.
         """
-        # Check if record exists using a metadata search
-        # We search with no vector and a filter
-        try:
-            results = self.table.search(None).where(f"file_hash = '{file_hash}'").to_list()
-            if not results:
-                return False
-        except Exception:
-            # Fallback to a broader check if the above fails
-            return False
-        
-        # Delete from database using file_hash
-        # Note: LanceDB delete operation
-        self.table.delete(f"file_hash = '{file_hash}'")
-        
-        # Also delete the image file if it exists
-        image_path = self.image_dir / f"{file_hash}.png"
-        if image_path.exists():
-            try:
-                image_path.unlink()
-            except OSError:
-                pass
-        
-        return True
+        return self.delete_images([file_hash]) > 0
+
+    def delete_images(self, file_hashes: Iterable[str]) -> int:
+        """
+        Deletes all images matching the given file hashes in a single delete.
+        Image files are only removed for hashes that had a database record.
+        Returns the number of database rows removed.
+        """
+        file_hashes = list(file_hashes)
+        if not file_hashes:
+            return 0
+        predicate = _hash_predicate(file_hashes)
+
+        # A single hash either matched or not, which the row count below tells
+        # us; for batches look up which hashes exist so only their files go
+        if len(file_hashes) == 1:
+            matched = file_hashes
+        else:
+            rows = (
+                self.table.search(None)
+                .where(predicate)
+                .select(["file_hash"])
+                .limit(None)
+                .to_list()
+            )
+            matched = sorted({row["file_hash"] for row in rows})
+            if not matched:
+                return 0
+
+        # Delete from database using file_hash; the row count tells us whether
+        # anything matched, so no separate existence query is needed
+        rows_before = self.table.count_rows()
+        self.table.delete(predicate)
+        deleted = rows_before - self.table.count_rows()
+        if not deleted:
+            return 0
+
+        # Also delete the image files of records that existed
+        for file_hash in matched:
+            image_path = self.image_dir / f"{file_hash}.png"
+            if image_path.exists():
+                try:
+                    image_path.unlink()
+                except OSError:
+                    pass
 
+        return deleted
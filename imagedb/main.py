@@ -1,32 +1,76 @@
 from __future__ import annotations
 
 import hashlib
-from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from PIL import Image
 from rich import print, box
-from rich.table import Table
-from rich.prompt import Prompt
 
 from .clipboard import ClipboardError, copy_image_to_clipboard, read_image_from_clipboard
 from .config import DEFAULT_VISION_MODEL, load_config, save_config
-from .database import ImageDB
-from .openrouter import describe_image, get_embedding
+
+# Heavy dependencies (lancedb, requests, rich tables/prompts) are imported
+# inside the commands that need them to keep `init` and `config` fast.
+if TYPE_CHECKING:
+    from .database import ImageDB
 
 app = typer.Typer(add_completion=False, help="Image database CLI.")
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
 
-def _hash_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def _read_clipboard_and_hash() -> tuple[bytes, str]:
+    """
+    Read the clipboard image, hashing each chunk as it arrives.
+    Returns the image bytes and their SHA-256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    image_bytes = read_image_from_clipboard(on_chunk=hasher.update)
+    return image_bytes, hasher.hexdigest()
 
 
 def _save_png_bytes(image_bytes: bytes, destination: Path) -> None:
+    """
+    Write clipboard PNG bytes as-is, without decoding or re-encoding.
+    """
     destination.write_bytes(image_bytes)
 
 
+@lru_cache(maxsize=1)
+def _db() -> ImageDB:
+    """
+    Return the process-wide ImageDB instance.
+    """
+    from .database import ImageDB
+
+    return ImageDB()
+
+
+def _get_field(item, name: str):
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _copy_result_to_clipboard(result) -> Path:
+    """
+    Copy the image file of a search result to the clipboard.
+    Exits with an error if the result has no usable file path.
+    """
+    path_value = _get_field(result, "path")
+    if not path_value:
+        print("[red]Result missing file path.[/red]")
+        raise typer.Exit(code=1)
+
+    path = Path(path_value)
+    if not path.exists():
+        print(f"[red]Image file missing at {path}[/red]")
+        raise typer.Exit(code=1)
+
+    copy_image_to_clipboard(path)
+    return path
+
+
 def _require_config():
     try:
         return load_config()
@@ -85,32 +129,60 @@ def save_command(
     """
     Copy image from clipboard into the DB (describe + embed).
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .openrouter import describe_image, get_embedding
+
     cfg = _require_config()
     api_key = cfg["api_key"]
     vision_model = cfg.get("vision_model", DEFAULT_VISION_MODEL)
 
     try:
-        image_bytes = read_image_from_clipboard()
+        image_bytes, file_hash = _read_clipboard_and_hash()
     except ClipboardError as exc:
         print(f"[red]{exc}[/red]")
         raise typer.Exit(code=1)
 
-    file_hash = _hash_bytes(image_bytes)
+    # Reject non-PNG data before any network call is made
+    if image_bytes[:8] != PNG_SIGNATURE:
+        print("[red]Clipboard data is not a PNG image.[/red]")
+        raise typer.Exit(code=1)
 
-    db = ImageDB()
+    db = _db()
     image_path = db.image_dir / f"{file_hash}.png"
+    already_saved = image_path.exists()
+
+    # Overlap the slow vision request with the local file write and DB lookup.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        description_future = executor.submit(
+            describe_image,
+            image_bytes,
+            api_key=api_key,
+            model=vision_model,
+            context=context,
+        )
+        exists_future = executor.submit(db.has_image, file_hash)
+        write_future = (
+            None
+            if already_saved
+            else executor.submit(_save_png_bytes, image_bytes, image_path)
+        )
+
+        if write_future is None:
+            print(f"[yellow]Image already saved at {image_path}[/yellow]")
+        else:
+            write_future.result()
+            print(f"[green]Saved image to {image_path}[/green]")
+
+        description = description_future.result()
+        in_database = exists_future.result()
 
-    if image_path.exists():
-        print(f"[yellow]Image already saved at {image_path}[/yellow]")
-    else:
-        _save_png_bytes(image_bytes, image_path)
-        print(f"[green]Saved image to {image_path}[/green]")
-
-    description = describe_image(
-        image_bytes, api_key=api_key, model=vision_model, context=context
-    )
     print(f"[cyan]Description:[/cyan] {description}")
 
+    if in_database:
+        print("[yellow]Image already stored in the database.[/yellow]")
+        raise typer.Exit()
+
     embedding = get_embedding(description, api_key=api_key)
     db.add_image(
         embedding=embedding,
@@ -126,28 +198,19 @@ def load_command(query: str):
     """
     Search by text and copy the best match to the clipboard.
     """
+    from .openrouter import get_query_embedding
+
     cfg = _require_config()
     api_key = cfg["api_key"]
 
-    embedding = get_embedding(query, api_key=api_key)
-    db = ImageDB()
+    embedding = get_query_embedding(query, api_key=api_key)
+    db = _db()
     results = db.search(embedding, limit=1)
     if not results:
         print("[yellow]No results found.[/yellow]")
         raise typer.Exit()
 
-    result = results[0]
-    path_value = result.get("path") if isinstance(result, dict) else getattr(result, "path", None)
-    if not path_value:
-        print("[red]Result missing file path.[/red]")
-        raise typer.Exit(code=1)
-
-    path = Path(path_value)
-    if not path.exists():
-        print(f"[red]Image file missing at {path}[/red]")
-        raise typer.Exit(code=1)
-
-    copy_image_to_clipboard(path)
+    path = _copy_result_to_clipboard(results[0])
     print(f"[green]Copied image to clipboard from {path}[/green]")
 
 
@@ -156,11 +219,16 @@ def search_command(query: str):
     """
     Search by text and show top 5 matches with metadata.
     """
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from .openrouter import get_query_embedding
+
     cfg = _require_config()
     api_key = cfg["api_key"]
 
-    embedding = get_embedding(query, api_key=api_key)
-    db = ImageDB()
+    embedding = get_query_embedding(query, api_key=api_key)
+    db = _db()
     results = db.search(embedding, limit=5)
 
     if not results:
@@ -175,13 +243,10 @@ def search_command(query: str):
     table.add_column("Path", style="dim")
 
     for idx, res in enumerate(results, start=1):
-        def get_field(item, name):
-            return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
-
-        dist = get_field(res, "_distance")
-        desc = get_field(res, "description")
-        created_at = get_field(res, "created_at")
-        path_val = get_field(res, "path")
+        dist = _get_field(res, "_distance")
+        desc = _get_field(res, "description")
+        created_at = _get_field(res, "created_at")
+        path_val = _get_field(res, "path")
 
         dist_str = f"{dist:.4f}" if dist is not None else "N/A"
         date_str = str(created_at)
@@ -201,23 +266,7 @@ def search_command(query: str):
         raise typer.Exit()
 
     selected_idx = int(choice) - 1
-    selected_res = results[selected_idx]
-
-    def get_field(item, name):
-        return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
-
-    path_value = get_field(selected_res, "path")
-    
-    if not path_value:
-         print("[red]Result missing file path.[/red]")
-         raise typer.Exit(code=1)
-
-    path = Path(path_value)
-    if not path.exists():
-        print(f"[red]Image file missing at {path}[/red]")
-        raise typer.Exit(code=1)
-
-    copy_image_to_clipboard(path)
+    path = _copy_result_to_clipboard(results[selected_idx])
     print(f"[green]Copied image #{choice} to clipboard from {path}[/green]")
 
 
@@ -227,15 +276,14 @@ def delete_command():
     Delete the image from the database that matches the image currently in clipboard (by hash).
     """
     try:
-        image_bytes = read_image_from_clipboard()
+        _, file_hash = _read_clipboard_and_hash()
     except ClipboardError as exc:
         print(f"[red]{exc}[/red]")
         raise typer.Exit(code=1)
 
-    file_hash = _hash_bytes(image_bytes)
     print(f"[dim]Clipboard image hash: {file_hash}[/dim]")
     
-    db = ImageDB()
+    db = _db()
     deleted = db.delete_image(file_hash)
     
     if deleted:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import base64
-import json
-from typing import List
+import dbm
+import functools
+import hashlib
+import os
+import shelve
+from pathlib import Path
 
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 EMBEDDING_MODEL = "qwen/qwen3-embedding-8b"
 CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -18,6 +25,39 @@ VISION_PROMPT = (
     "No markdown."
 )
 
+# Shared session so the vision and embedding calls reuse one TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+IMAGE_URL_PREFIX = b"data:image/png;base64,"
+_IMAGE_URL_PLACEHOLDER = "__imagedb_image_url__"
+# Base64 maps 3 input bytes to 4 output bytes, so chunks must be multiples of 3.
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+
+class _ImageRequestBody:
+    """
+    JSON request body whose image data URL is base64-encoded in chunks while
+    it is sent, so the full base64 string is never held in memory.
+    """
+
+    def __init__(self, payload: dict, image_bytes: bytes):
+        body = orjson.dumps(payload)
+        # The placeholder sits after any user-supplied text in the payload
+        self._prefix, self._suffix = body.rsplit(_IMAGE_URL_PLACEHOLDER.encode("ascii"), 1)
+        self._image = memoryview(image_bytes)
+
+    def __len__(self) -> int:
+        encoded_size = 4 * ((len(self._image) + 2) // 3)
+        return len(self._prefix) + len(IMAGE_URL_PREFIX) + encoded_size + len(self._suffix)
+
+    def __iter__(self):
+        yield self._prefix
+        yield IMAGE_URL_PREFIX
+        for start in range(0, len(self._image), _B64_CHUNK_SIZE):
+            yield base64.b64encode(self._image[start:start + _B64_CHUNK_SIZE])
+        yield self._suffix
+
 
 def _headers(api_key: str) -> dict:
     return {
@@ -27,12 +67,14 @@ def _headers(api_key: str) -> dict:
 
 
 def describe_image(
-    image_bytes: bytes, api_key: str, model: str, context: str | None = None
+    image_bytes: bytes,
+    api_key: str,
+    model: str,
+    context: str | None = None,
 ) -> str:
     """
     Call OpenRouter vision model to get a description of the image.
     """
-    b64 = base64.b64encode(image_bytes).decode("utf-8")
     prompt = (
         f"{VISION_PROMPT} Integrate the following user context to identify specific entities (like names) or capture the intended mood/emotion: {context}. "
         "Use this information to inform your description naturally without repeating the context verbatim."
@@ -48,19 +90,20 @@ def describe_image(
                     {"type": "text", "text": prompt},
                     {
                         "type": "image_url",
-                        "image_url": {"url": f"data:image/png;base64,{b64}"},
+                        "image_url": {"url": _IMAGE_URL_PLACEHOLDER},
                     },
                 ],
             }
         ],
     }
 
-    resp = requests.post(CHAT_URL, headers=_headers(api_key), data=json.dumps(payload))
+    body = _ImageRequestBody(payload, image_bytes)
+    resp = _SESSION.post(CHAT_URL, headers=_headers(api_key), data=body)
     if resp.status_code != 200:
         raise RuntimeError(
             f"Vision API error {resp.status_code}: {resp.text[:200]}"
         )
-    data = resp.json()
+    data = orjson.loads(resp.content)
     choices = data.get("choices") or []
     if not choices:
         raise RuntimeError("Vision API returned no choices.")
@@ -76,26 +119,73 @@ def describe_image(
     raise RuntimeError("Unexpected vision response format.")
 
 
-def get_embedding(text: str, api_key: str) -> List[float]:
+def _get_embedding_cache_path() -> Path:
+    """
+    Return the path to the on-disk embedding cache, honoring XDG base dir.
+    """
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    cache_dir = base / "imagedb"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / "embeddings.db"
+
+
+def _embedding_cache_key(text: str) -> str:
+    return hashlib.sha1(f"{EMBEDDING_MODEL}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _read_cached_embedding(key: str) -> np.ndarray | None:
+    try:
+        with shelve.open(str(_get_embedding_cache_path()), flag="r") as cache:
+            cached = cache.get(key)
+    except dbm.error:
+        return None
+    return None if cached is None else np.asarray(cached, dtype=np.float32)
+
+
+def _write_cached_embedding(key: str, embedding: np.ndarray) -> None:
+    try:
+        with shelve.open(str(_get_embedding_cache_path())) as cache:
+            cache[key] = embedding
+    except dbm.error:
+        pass
+
+
+@functools.lru_cache(maxsize=512)
+def get_query_embedding(text: str, api_key: str) -> np.ndarray:
     """
-    Fetch an embedding vector for the provided text.
+    Fetch an embedding for a search query, cached in memory and on disk.
+    Queries are often retyped, unlike image descriptions, so only they are cached.
+    """
+    key = _embedding_cache_key(text)
+    cached = _read_cached_embedding(key)
+    if cached is not None:
+        return cached
+
+    embedding = get_embedding(text, api_key)
+    _write_cached_embedding(key, embedding)
+    return embedding
+
+
+def get_embedding(text: str, api_key: str) -> np.ndarray:
+    """
+    Fetch an embedding vector for the provided text as a float32 array.
     """
     payload = {
         "model": EMBEDDING_MODEL,
         "input": text,
         "encoding_format": "float",
     }
-    resp = requests.post(EMBED_URL, headers=_headers(api_key), data=json.dumps(payload))
+    resp = _SESSION.post(EMBED_URL, headers=_headers(api_key), data=orjson.dumps(payload))
     if resp.status_code != 200:
         raise RuntimeError(
             f"Embedding API error {resp.status_code}: {resp.text[:200]}"
         )
-    data = resp.json()
+    data = orjson.loads(resp.content)
     embed_list = data.get("data", [])
     if not embed_list:
         raise RuntimeError("Embedding API returned no data.")
     embedding = embed_list[0].get("embedding")
     if not embedding:
         raise RuntimeError("Embedding missing in response.")
-    return embedding
+    return np.asarray(embedding, dtype=np.float32)
 